@@ -0,0 +1,62 @@
+"""
+Lakebase PostgreSQL client for low-latency point lookups.
+
+setup_lakebase_sync.py keeps PK-indexed copies of the app-facing tables
+in the Lakebase Postgres instance. An indexed lookup there is
+sub-millisecond, while even a tiny Spark query pays hundreds of
+milliseconds of job-submission overhead first — so the query layer
+routes single/few-row reads here when a connection is configured and
+falls back to Spark otherwise.
+
+Configuration comes from environment variables:
+- LAKEBASE_PG_DSN: libpq connection string for the Lakebase instance
+  (e.g. "host=... dbname=investigative_analytics user=... password=...")
+- LAKEBASE_PG_SCHEMA: schema holding the synced tables (default "demo")
+"""
+
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    from psycopg.rows import dict_row
+    from psycopg_pool import ConnectionPool
+except ImportError:
+    dict_row = None
+    ConnectionPool = None
+
+PG_SCHEMA = os.environ.get("LAKEBASE_PG_SCHEMA", "demo")
+
+_pool: Optional["ConnectionPool"] = None
+
+
+def lakebase_available() -> bool:
+    """True when psycopg is installed and a Lakebase DSN is configured."""
+    return ConnectionPool is not None and bool(os.environ.get("LAKEBASE_PG_DSN"))
+
+
+def get_pg_pool() -> "ConnectionPool":
+    """Get or create the shared connection pool to the Lakebase instance."""
+    global _pool
+    if _pool is None:
+        _pool = ConnectionPool(
+            conninfo=os.environ["LAKEBASE_PG_DSN"],
+            min_size=1,
+            max_size=8,
+        )
+    return _pool
+
+
+def fetch_all(query: str, params: Tuple = ()) -> List[Dict[str, Any]]:
+    """Run a query against Lakebase and return all rows as dicts."""
+    with get_pg_pool().connection() as conn:
+        with conn.cursor(row_factory=dict_row) as cur:
+            cur.execute(query, params)
+            return cur.fetchall()
+
+
+def fetch_one(query: str, params: Tuple = ()) -> Optional[Dict[str, Any]]:
+    """Run a query against Lakebase and return the first row, if any."""
+    with get_pg_pool().connection() as conn:
+        with conn.cursor(row_factory=dict_row) as cur:
+            cur.execute(query, params)
+            return cur.fetchone()
@@ -50,7 +50,7 @@ print(f"Lakebase instance: {lakebase_instance}")
 
 # COMMAND ----------
 
-# All 12 app-facing tables with their primary keys
+# All 13 app-facing tables with their primary keys
 SYNCED_TABLES = [
     # Silver layer tables
     {"name": "cases_silver", "pk": ["case_id"]},
@@ -66,6 +66,7 @@ SYNCED_TABLES = [
     {"name": "evidence_card_data", "pk": ["device_id"]},
     {"name": "handoff_candidates", "pk": ["old_entity_id", "new_entity_id", "h3_cell"]},
     {"name": "case_summary_with_suspects", "pk": ["case_id"]},
+    {"name": "evidence_card_signals", "pk": ["entity_id", "case_a", "case_b"]},
 ]
 
 print(f"Will create {len(SYNCED_TABLES)} synced tables")
@@ -79,6 +80,8 @@ for t in SYNCED_TABLES:
 
 # COMMAND ----------
 
+from concurrent.futures import ThreadPoolExecutor
+
 from databricks.sdk import WorkspaceClient
 from databricks.sdk.service.database import (
     SyncedDatabaseTable,
@@ -89,24 +92,19 @@ from databricks.sdk.service.database import (
 
 w = WorkspaceClient()
 
-results = []
-
 # Use SNAPSHOT mode because DLT materialized views don't support Change Data Feed
 # (which is required for TRIGGERED/CONTINUOUS modes)
 SYNC_MODE = SyncedTableSchedulingPolicy.SNAPSHOT
 
-for table_def in SYNCED_TABLES:
+
+def _create_one(table_def):
+    """Create a single synced table; returns a result dict, never raises."""
     table_name = table_def["name"]
     pk_columns = table_def["pk"]
 
     source_fqn = f"{source_catalog}.{source_schema}.{table_name}"
     dest_fqn = f"{lakebase_catalog}.{source_schema}.{table_name}"
 
-    print(f"\nCreating synced table: {dest_fqn}")
-    print(f"  Source: {source_fqn}")
-    print(f"  Primary key: {pk_columns}")
-    print(f"  Sync mode: SNAPSHOT")
-
     try:
         synced_table = w.database.create_synced_database_table(
             SyncedDatabaseTable(
@@ -124,17 +122,57 @@ for table_def in SYNCED_TABLES:
                 ),
             )
         )
-        print(f"  SUCCESS: Created {synced_table.name}")
-        results.append({"table": table_name, "status": "created", "error": None})
+        pipeline_id = synced_table.spec.pipeline_id if synced_table.spec else None
+        print(f"  SUCCESS: Created {synced_table.name} (PK: {pk_columns})")
+        return {"table": table_name, "status": "created", "pipeline_id": pipeline_id, "error": None}
     except Exception as e:
         error_msg = str(e)
-        # If table already exists, that's OK
+        # If table already exists, that's OK — but still capture its
+        # pipeline_id so the persisted map below stays complete on re-runs
         if "already exists" in error_msg.lower():
             print(f"  SKIPPED: {table_name} already exists")
-            results.append({"table": table_name, "status": "exists", "error": None})
-        else:
-            print(f"  FAILED: {error_msg}")
-            results.append({"table": table_name, "status": "failed", "error": error_msg})
+            try:
+                existing = w.database.get_synced_database_table(name=dest_fqn)
+                pipeline_id = existing.spec.pipeline_id if existing.spec else None
+            except Exception:
+                pipeline_id = None
+            return {"table": table_name, "status": "exists", "pipeline_id": pipeline_id, "error": None}
+        print(f"  FAILED: {table_name}: {error_msg}")
+        return {"table": table_name, "status": "failed", "pipeline_id": None, "error": error_msg}
+
+
+# Each create is a synchronous control-plane round trip; the SDK client is
+# thread-safe and the calls are independent, so issue them concurrently.
+print(f"Creating {len(SYNCED_TABLES)} synced tables (sync mode: SNAPSHOT)...")
+with ThreadPoolExecutor(max_workers=min(12, len(SYNCED_TABLES))) as ex:
+    results = list(ex.map(_create_one, SYNCED_TABLES))
+
+# COMMAND ----------
+
+# MAGIC %md
+# MAGIC ## Persist Pipeline IDs
+# MAGIC
+# MAGIC `trigger_lakebase_sync.py` needs each synced table's underlying
+# MAGIC pipeline id. Persist the mapping once here so every trigger run
+# MAGIC reads it in one table scan instead of one REST GET per table.
+
+# COMMAND ----------
+
+pipeline_id_rows = [
+    (r["table"], r["pipeline_id"])
+    for r in results
+    if r.get("pipeline_id")
+]
+
+if pipeline_id_rows:
+    (
+        spark.createDataFrame(pipeline_id_rows, "table_name STRING, pipeline_id STRING")
+        .write.mode("overwrite")
+        .saveAsTable(f"{source_catalog}.{source_schema}._synced_pipeline_ids")
+    )
+    print(f"Persisted {len(pipeline_id_rows)} pipeline id(s) to _synced_pipeline_ids")
+else:
+    print("No pipeline ids to persist")
 
 # COMMAND ----------
 
@@ -10,6 +10,7 @@
 # MAGIC
 # MAGIC **Parameters:**
 # MAGIC - `lakebase_catalog`: UC database catalog for the Lakebase instance
+# MAGIC - `source_catalog`: Unity Catalog name holding the pipeline-id map
 # MAGIC - `source_schema`: Schema name (e.g. `demo`)
 
 # COMMAND ----------
@@ -23,17 +24,20 @@ dbutils.library.restartPython()
 # COMMAND ----------
 
 dbutils.widgets.text("lakebase_catalog", "investigative_analytics_pg")
+dbutils.widgets.text("source_catalog", "pubsec_geo_law")
 dbutils.widgets.text("source_schema", "demo")
 
 lakebase_catalog = dbutils.widgets.get("lakebase_catalog")
+source_catalog = dbutils.widgets.get("source_catalog")
 source_schema = dbutils.widgets.get("source_schema")
 
 print(f"Lakebase catalog: {lakebase_catalog}")
+print(f"Source catalog: {source_catalog}")
 print(f"Source schema: {source_schema}")
 
 # COMMAND ----------
 
-# All 12 app-facing synced tables
+# All 13 app-facing synced tables
 SYNCED_TABLE_NAMES = [
     "cases_silver",
     "location_events_silver",
@@ -47,6 +51,7 @@ SYNCED_TABLE_NAMES = [
     "evidence_card_data",
     "handoff_candidates",
     "case_summary_with_suspects",
+    "evidence_card_signals",
 ]
 
 # COMMAND ----------
@@ -56,46 +61,71 @@ SYNCED_TABLE_NAMES = [
 
 # COMMAND ----------
 
+from concurrent.futures import ThreadPoolExecutor
+
 from databricks.sdk import WorkspaceClient
 import time
 
 w = WorkspaceClient()
 
-results = []
+MAX_WORKERS = min(12, len(SYNCED_TABLE_NAMES))
+
+# setup_lakebase_sync.py persists each synced table's pipeline_id; load
+# the map once so triggering doesn't start with one REST GET per table.
+PIPELINE_IDS_FQN = f"{source_catalog}.{source_schema}._synced_pipeline_ids"
+try:
+    pipeline_ids = {
+        r["table_name"]: r["pipeline_id"]
+        for r in spark.table(PIPELINE_IDS_FQN).collect()
+    }
+    print(f"Loaded {len(pipeline_ids)} pipeline id(s) from {PIPELINE_IDS_FQN}")
+except Exception as e:
+    pipeline_ids = {}
+    print(f"Could not read {PIPELINE_IDS_FQN} ({e}); falling back to per-table lookups")
+
 
-for table_name in SYNCED_TABLE_NAMES:
+def _trigger_one(table_name):
+    """Trigger a refresh for one synced table; returns a result dict."""
     fqn = f"{lakebase_catalog}.{source_schema}.{table_name}"
-    print(f"Triggering refresh for: {fqn}")
 
     try:
-        # Get the synced table to find its underlying pipeline
-        synced_table = w.database.get_synced_database_table(name=fqn)
+        pipeline_id = pipeline_ids.get(table_name)
+        if not pipeline_id:
+            # Not in the persisted map (stale or missing) — fall back to
+            # looking the synced table up directly
+            synced_table = w.database.get_synced_database_table(name=fqn)
 
-        if not synced_table.spec or not synced_table.spec.pipeline_id:
-            print(f"  WARNING: No pipeline_id found for {table_name}, skipping")
-            results.append({"table": table_name, "status": "skipped", "error": "no pipeline_id"})
-            continue
+            if not synced_table.spec or not synced_table.spec.pipeline_id:
+                print(f"  WARNING: No pipeline_id found for {table_name}, skipping")
+                return {"table": table_name, "status": "skipped", "error": "no pipeline_id"}
 
-        pipeline_id = synced_table.spec.pipeline_id
+            pipeline_id = synced_table.spec.pipeline_id
 
         # Trigger a pipeline update (refresh)
         update = w.pipelines.start_update(
             pipeline_id=pipeline_id,
             refresh_selection=[fqn],
         )
-        print(f"  Triggered pipeline {pipeline_id}, update_id: {update.update_id}")
-        results.append({
+        print(f"  {table_name}: triggered pipeline {pipeline_id}, update_id: {update.update_id}")
+        return {
             "table": table_name,
             "status": "triggered",
             "pipeline_id": pipeline_id,
             "update_id": update.update_id,
             "error": None,
-        })
+        }
 
     except Exception as e:
         error_msg = str(e)
-        print(f"  FAILED: {error_msg}")
-        results.append({"table": table_name, "status": "failed", "error": error_msg})
+        print(f"  {table_name} FAILED: {error_msg}")
+        return {"table": table_name, "status": "failed", "error": error_msg}
+
+
+# Each trigger is an independent control-plane round trip; fire them
+# concurrently instead of serially waiting on each response.
+print(f"Triggering refresh for {len(SYNCED_TABLE_NAMES)} synced tables...")
+with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+    results = list(ex.map(_trigger_one, SYNCED_TABLE_NAMES))
 
 # COMMAND ----------
 
@@ -117,37 +147,72 @@ else:
     pending = {r["table"]: r for r in triggered}
     completed = {}
 
+    def _check_status(table_name):
+        """Fetch one table's sync state; returns (table, state, message)."""
+        fqn = f"{lakebase_catalog}.{source_schema}.{table_name}"
+        try:
+            status = w.database.get_synced_database_table(name=fqn)
+            state = (
+                status.data_synchronization_status.detailed_state
+                if status.data_synchronization_status
+                else "UNKNOWN"
+            )
+            msg = (
+                status.data_synchronization_status.message
+                if status.data_synchronization_status
+                else None
+            )
+            return (table_name, state, msg)
+        except Exception as e:
+            return (table_name, "CHECK_ERROR", str(e))
+
+    # Newer SDKs expose a list endpoint for synced tables; one listing
+    # per tick replaces a GET per pending table.
+    _HAS_LIST = hasattr(w.database, "list_synced_database_tables")
+
+    def _poll_states(table_names):
+        """Return {table: (state, message)} for the given tables."""
+        if _HAS_LIST:
+            try:
+                listed = {}
+                for t in w.database.list_synced_database_tables(
+                    catalog=lakebase_catalog, schema=source_schema
+                ):
+                    status = t.data_synchronization_status
+                    short_name = t.name.split(".")[-1] if t.name else ""
+                    listed[short_name] = (
+                        status.detailed_state if status else "UNKNOWN",
+                        status.message if status else None,
+                    )
+                return {t: listed.get(t, ("UNKNOWN", None)) for t in table_names}
+            except Exception as e:
+                return {t: ("CHECK_ERROR", str(e)) for t in table_names}
+        # SDK without the list endpoint: concurrent per-table GETs
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+            checked = list(ex.map(_check_status, table_names))
+        return {t: (state, msg) for t, state, msg in checked}
+
     while pending and (time.time() - start_time) < MAX_WAIT_SECONDS:
         time.sleep(POLL_INTERVAL)
         elapsed = int(time.time() - start_time)
 
-        for table_name in list(pending.keys()):
-            fqn = f"{lakebase_catalog}.{source_schema}.{table_name}"
-            try:
-                status = w.database.get_synced_database_table(name=fqn)
-                state = (
-                    status.data_synchronization_status.detailed_state
-                    if status.data_synchronization_status
-                    else "UNKNOWN"
-                )
-
-                if state in ("ONLINE", "ACTIVE"):
-                    print(f"  [{elapsed}s] {table_name}: {state} (complete)")
-                    completed[table_name] = pending.pop(table_name)
-                elif state in ("FAILED", "ERROR"):
-                    msg = (
-                        status.data_synchronization_status.message
-                        if status.data_synchronization_status
-                        else "unknown error"
-                    )
-                    print(f"  [{elapsed}s] {table_name}: {state} - {msg}")
-                    pending[table_name]["status"] = "failed"
-                    pending[table_name]["error"] = msg
-                    completed[table_name] = pending.pop(table_name)
-                else:
-                    print(f"  [{elapsed}s] {table_name}: {state} (in progress)")
-            except Exception as e:
-                print(f"  [{elapsed}s] {table_name}: ERROR checking status - {e}")
+        # Poll all pending tables at once; state transitions are applied
+        # on this thread so pending/completed stay consistent.
+        statuses = _poll_states(list(pending.keys()))
+
+        for table_name, (state, msg) in statuses.items():
+            if state in ("ONLINE", "ACTIVE"):
+                print(f"  [{elapsed}s] {table_name}: {state} (complete)")
+                completed[table_name] = pending.pop(table_name)
+            elif state in ("FAILED", "ERROR"):
+                print(f"  [{elapsed}s] {table_name}: {state} - {msg or 'unknown error'}")
+                pending[table_name]["status"] = "failed"
+                pending[table_name]["error"] = msg or "unknown error"
+                completed[table_name] = pending.pop(table_name)
+            elif state == "CHECK_ERROR":
+                print(f"  [{elapsed}s] {table_name}: ERROR checking status - {msg}")
+            else:
+                print(f"  [{elapsed}s] {table_name}: {state} (in progress)")
 
     if pending:
         print(f"\nWARNING: {len(pending)} table(s) did not complete within {MAX_WAIT_SECONDS}s:")
@@ -35,6 +35,10 @@ SUSPECT_1_ID = "E_0412"
 SUSPECT_2_ID = "E_1098"
 BURNER_ENTITY_ID = "E_7734"
 
+# Shared across checks; isin over this list compiles to In predicates
+# that push straight into the Delta scan's data skipping
+SUSPECT_IDS = [SUSPECT_1_ID, SUSPECT_2_ID]
+
 DC_INCIDENT_ENTITY_COUNT = 50
 
 # COMMAND ----------
@@ -44,252 +48,420 @@ DC_INCIDENT_ENTITY_COUNT = 50
 
 # COMMAND ----------
 
-from pyspark.sql import functions as F
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 
-def check_assertion(name: str, condition: bool, message: str = ""):
-    """Print validation result and return status."""
-    status = "✅ PASS" if condition else "❌ FAIL"
-    print(f"{status}: {name}")
-    if not condition and message:
-        print(f"   → {message}")
-    return condition
+from pyspark.sql import functions as F
 
-def run_all_validations():
-    """Run all validation checks and return summary."""
+@dataclass
+class CheckResult:
+    """Outcome of a single validation assertion."""
+    name: str
+    passed: bool
+    message: str = ""
+
+def check_assertion(name: str, condition: bool, message: str = "") -> CheckResult:
+    """Evaluate one assertion and return its result.
+
+    Pure: no I/O here, so checks can be reordered or run concurrently
+    without scrambling the report. Rendering happens in report().
+    """
+    return CheckResult(name=name, passed=bool(condition), message=message)
+
+def report(lines):
+    """Render buffered report lines and check results in one write."""
+    rendered = []
+    for item in lines:
+        if isinstance(item, CheckResult):
+            status = "✅ PASS" if item.passed else "❌ FAIL"
+            rendered.append(f"{status}: {item.name}")
+            if not item.passed and item.message:
+                rendered.append(f"   → {item.message}")
+        else:
+            rendered.append(item)
+    print("\n".join(rendered))
+
+def run_all_validations(verbose: bool = True, fail_fast: bool = False):
+    """Run all validation checks and return summary.
+
+    verbose adds cosmetic score/case-count detail lines to the report;
+    turning it off also drops those columns from the ranking scans.
+    fail_fast stops after the structural device-count check fails, so a
+    broken generation run doesn't spend seven more checks' worth of
+    driver time confirming the obvious.
+    """
     results = []
     
-    # Set catalog/schema
-    spark.sql(f"USE CATALOG {CATALOG}")
-    spark.sql(f"USE SCHEMA {SCHEMA}")
-    
-    print("=" * 60)
-    print("DATA GENERATION VALIDATION REPORT")
-    print("=" * 60)
-    print()
-    
+    # Set catalog/schema via the catalog API — no SQL parse round trip
+    spark.catalog.setCurrentCatalog(CATALOG)
+    spark.catalog.setCurrentDatabase(SCHEMA)
+
+    # location_events_silver and suspect_rankings each back several
+    # checks; a lazy cache turns the repeat reads into in-memory scans
+    # without forcing an eager materialization job up front.
+    cached_tables = ["location_events_silver", "suspect_rankings"]
+    for table in cached_tables:
+        spark.sql(f"CACHE LAZY TABLE {table}")
+    try:
+        return _run_checks(results, verbose, fail_fast)
+    finally:
+        for table in cached_tables:
+            spark.sql(f"UNCACHE TABLE IF EXISTS {table}")
+
+
+def _run_checks(results, verbose, fail_fast):
+    """Execute the check blocks; split out so caching can wrap them."""
+    # Buffer report lines and flush once before the summary: the driver
+    # moves straight to the next future instead of stalling on notebook
+    # output after every blocking result
+    out = []
+
+    def _record(result):
+        results.append(result)
+        out.append(result)
+
+    out.append("=" * 60)
+    out.append("DATA GENERATION VALIDATION REPORT")
+    out.append("=" * 60)
+    out.append("")
+
+    events = spark.table("location_events_silver")
+
+    # Checks 1, 2, 3 and the suspect-disappearance part of check 5 all
+    # aggregate location_events_silver. One conditional-aggregation query
+    # computes every scalar in a single scan/job instead of four; the
+    # outer filter keeps predicate pushdown effective for file skipping.
+    # DataFrame expressions over bound literals (instead of f-string SQL)
+    # let Catalyst fold the constants and reuse the plan fragments.
+    # Compare against time_bucket_ts (the clustering column) with folded
+    # timestamp literals, not the time_bucket string: predicates on the
+    # cluster key are what Delta's file-skipping stats are organized by.
+    # time_bucket_ts is to_timestamp(time_bucket), so the values match 1:1.
+    in_dc = (
+        (F.col("h3_cell") == DC_INCIDENT_H3_CELL) &
+        (F.col("time_bucket_ts") == F.to_timestamp(F.lit(DC_INCIDENT_BUCKET)))
+    )
+    in_nash = (
+        (F.col("h3_cell") == NASHVILLE_INCIDENT_H3_CELL) &
+        (F.col("time_bucket_ts") == F.to_timestamp(F.lit(NASHVILLE_INCIDENT_BUCKET)))
+    )
+    after_switch = (
+        F.col("time_bucket_ts") >= F.to_timestamp(F.lit(BURNER_SWITCH_BUCKET))
+    )
+    is_s1 = F.col("entity_id") == SUSPECT_1_ID
+    is_s2 = F.col("entity_id") == SUSPECT_2_ID
+
+    # Two-stage aggregate: collapse to per-entity flags first, then sum
+    # the flags. The per-entity GROUP BY runs as a distributed partial
+    # aggregate, and summing flags gives the exact distinct device count
+    # without the Expand plan a mixed COUNT(DISTINCT) would introduce.
+    per_entity = (
+        events
+        .where(
+            F.col("h3_cell").isin(DC_INCIDENT_H3_CELL, NASHVILLE_INCIDENT_H3_CELL) |
+            is_s1
+        )
+        .groupBy("entity_id")
+        .agg(
+            F.max(F.when(in_dc, 1).otherwise(0)).alias("in_dc"),
+            F.max(F.when(in_nash, 1).otherwise(0)).alias("in_nash"),
+            F.sum(F.when(after_switch, 1).otherwise(0))
+                .alias("events_after_switch")
+        )
+    )
+
+    ev_query = per_entity.agg(
+        F.sum("in_dc").alias("dc_device_count"),
+        F.max(F.when(is_s1, F.col("in_dc")).otherwise(0)).alias("s1_in_dc"),
+        F.max(F.when(is_s2, F.col("in_dc")).otherwise(0)).alias("s2_in_dc"),
+        F.max(F.when(is_s1, F.col("in_nash")).otherwise(0)).alias("s1_in_nash"),
+        F.max(F.when(is_s2, F.col("in_nash")).otherwise(0)).alias("s2_in_nash"),
+        F.sum(F.when(is_s1, F.col("events_after_switch")).otherwise(0))
+            .alias("s1_events_after_switch")
+    )
+
+    overlap_query = (
+        spark.table("entity_case_overlap")
+        .where(F.col("entity_id").isin(SUSPECT_IDS))
+        .groupBy("entity_id")
+        .agg(F.countDistinct("case_id").alias("case_count"))
+    )
+
+    burner_first_query = (
+        events
+        .where(F.col("entity_id") == BURNER_ENTITY_ID)
+        # min_by picks the cell of the earliest sighting in one aggregate
+        # pass — no GROUP BY, no sort, no LIMIT exchange
+        .agg(
+            F.min("time_bucket").alias("first_bucket"),
+            F.min_by("h3_cell", "time_bucket").alias("h3_cell")
+        )
+    )
+
+    # The pair can appear in either (entity_id_1, entity_id_2) order, but
+    # an OR across the two orderings defeats file skipping — only one
+    # branch is pruneable per file. A UNION ALL of two equality-only
+    # branches lets each side push both predicates into its scan, and
+    # only existence matters to the check, so limit 1 short-circuits.
+    co_presence = spark.table("co_presence_edges")
+
+    def _pair_branch(first, second):
+        return (
+            co_presence
+            .where(
+                (F.col("entity_id_1") == first) &
+                (F.col("entity_id_2") == second)
+            )
+            .select(F.lit(1).alias("found"))
+            .limit(1)
+        )
+
+    burner_pair_query = (
+        _pair_branch(BURNER_ENTITY_ID, SUSPECT_2_ID)
+        .unionAll(_pair_branch(SUSPECT_2_ID, BURNER_ENTITY_ID))
+        .limit(1)
+    )
+
+    # Project only what the checks assert; the score and case/state
+    # detail columns are display-only, so skip their Parquet column
+    # chunks entirely when not in verbose mode
+    handoff_cols = ["old_entity_id", "new_entity_id", "rank"]
+    if verbose:
+        handoff_cols.append("handoff_score")
+    handoff_query = (
+        spark.table("handoff_candidates")
+        .where(F.col("rank") == 1)
+        .select(*handoff_cols)
+    )
+
+    # One scan serves checks 7 and 8: the top-2 ranks plus the suspects'
+    # rows, bucketed in Python where each check consumes them
+    ranking_cols = ["entity_id", "rank", "states_count"]
+    if verbose:
+        ranking_cols += ["total_score", "unique_cases"]
+    rankings_query = (
+        spark.table("suspect_rankings")
+        .where(
+            (F.col("rank") <= 2) |
+            F.col("entity_id").isin(SUSPECT_IDS)
+        )
+        .select(*ranking_cols)
+        .orderBy("rank")
+    )
+
+    # The check queries are independent of one another; submit them all
+    # up front so the cluster works on them concurrently and wall-clock
+    # time tracks the slowest job, not the sum. Results are consumed in
+    # report order below.
+    executor = ThreadPoolExecutor(max_workers=8)
+
+    def _submit(action):
+        def _run():
+            # Named fair-scheduler pool so the concurrent validation jobs
+            # share executors instead of queueing FIFO
+            spark.sparkContext.setLocalProperty("spark.scheduler.pool", "validation")
+            return action()
+        return executor.submit(_run)
+
+    ev_future = _submit(ev_query.first)
+    overlap_future = _submit(overlap_query.collect)
+    burner_first_future = _submit(burner_first_query.first)
+    burner_pair_future = _submit(burner_pair_query.first)
+    handoff_future = _submit(handoff_query.collect)
+    rankings_future = _submit(rankings_query.collect)
+    # No more submissions; queued work still runs to completion
+    executor.shutdown(wait=False)
+
+    ev = ev_future.result()
+
     # =========================================================================
     # CHECK 1: DC Incident Cell has 50 devices
     # =========================================================================
-    print("📍 CHECK 1: DC Incident Cell Device Count")
-    print("-" * 40)
-    
-    dc_count = spark.sql(f"""
-        SELECT COUNT(DISTINCT entity_id) as device_count
-        FROM location_events_silver
-        WHERE h3_cell = '{DC_INCIDENT_H3_CELL}'
-          AND time_bucket = '{DC_INCIDENT_BUCKET}'
-    """).collect()[0]["device_count"]
-    
-    results.append(check_assertion(
+    out.append("📍 CHECK 1: DC Incident Cell Device Count")
+    out.append("-" * 40)
+
+    dc_count = ev["dc_device_count"]
+
+    _record(check_assertion(
         "DC incident cell has exactly 50 devices",
         dc_count == DC_INCIDENT_ENTITY_COUNT,
         f"Expected {DC_INCIDENT_ENTITY_COUNT}, got {dc_count}"
     ))
-    print()
-    
+    out.append("")
+
+    if fail_fast and not results[-1].passed:
+        # The structural check failed: the data evidently wasn't
+        # generated, so the remaining checks can only fail too. The
+        # already-submitted futures finish in the background (running
+        # Spark jobs can't be cancelled here), but nothing blocks on them.
+        out.append("⏭️  fail_fast: structural check failed, skipping remaining checks")
+        report(out)
+        return False
+
     # =========================================================================
     # CHECK 2: Both suspects present in DC cell
     # =========================================================================
-    print("👥 CHECK 2: Suspects Present in DC Incident")
-    print("-" * 40)
-    
-    dc_suspects = spark.sql(f"""
-        SELECT entity_id
-        FROM location_events_silver
-        WHERE h3_cell = '{DC_INCIDENT_H3_CELL}'
-          AND time_bucket = '{DC_INCIDENT_BUCKET}'
-          AND entity_id IN ('{SUSPECT_1_ID}', '{SUSPECT_2_ID}')
-    """).collect()
-    
-    dc_suspect_ids = [r["entity_id"] for r in dc_suspects]
-    results.append(check_assertion(
+    out.append("👥 CHECK 2: Suspects Present in DC Incident")
+    out.append("-" * 40)
+
+    _record(check_assertion(
         f"Suspect 1 ({SUSPECT_1_ID}) present in DC incident",
-        SUSPECT_1_ID in dc_suspect_ids
+        ev["s1_in_dc"] == 1
     ))
-    results.append(check_assertion(
+    _record(check_assertion(
         f"Suspect 2 ({SUSPECT_2_ID}) present in DC incident",
-        SUSPECT_2_ID in dc_suspect_ids
+        ev["s2_in_dc"] == 1
     ))
-    print()
-    
+    out.append("")
+
     # =========================================================================
     # CHECK 3: Suspects appear in Nashville
     # =========================================================================
-    print("🎸 CHECK 3: Suspects Present in Nashville Incident")
-    print("-" * 40)
-    
-    nash_suspects = spark.sql(f"""
-        SELECT entity_id
-        FROM location_events_silver
-        WHERE h3_cell = '{NASHVILLE_INCIDENT_H3_CELL}'
-          AND time_bucket = '{NASHVILLE_INCIDENT_BUCKET}'
-          AND entity_id IN ('{SUSPECT_1_ID}', '{SUSPECT_2_ID}')
-    """).collect()
-    
-    nash_suspect_ids = [r["entity_id"] for r in nash_suspects]
-    results.append(check_assertion(
+    out.append("🎸 CHECK 3: Suspects Present in Nashville Incident")
+    out.append("-" * 40)
+
+    _record(check_assertion(
         f"Suspect 1 ({SUSPECT_1_ID}) present in Nashville",
-        SUSPECT_1_ID in nash_suspect_ids
+        ev["s1_in_nash"] == 1
     ))
-    results.append(check_assertion(
+    _record(check_assertion(
         f"Suspect 2 ({SUSPECT_2_ID}) present in Nashville",
-        SUSPECT_2_ID in nash_suspect_ids
+        ev["s2_in_nash"] == 1
     ))
-    print()
+    out.append("")
     
     # =========================================================================
     # CHECK 4: Suspect pair appears in ≥ 3 burglary windows
     # =========================================================================
-    print("🔄 CHECK 4: Suspects Appear in Multiple Burglary Windows")
-    print("-" * 40)
+    out.append("🔄 CHECK 4: Suspects Appear in Multiple Burglary Windows")
+    out.append("-" * 40)
     
-    suspect_case_overlap = spark.sql(f"""
-        SELECT entity_id, COUNT(DISTINCT case_id) as case_count
-        FROM entity_case_overlap
-        WHERE entity_id IN ('{SUSPECT_1_ID}', '{SUSPECT_2_ID}')
-        GROUP BY entity_id
-    """).collect()
+    suspect_case_overlap = overlap_future.result()
+    assert len(suspect_case_overlap) < 100, "validation query returned too many rows"
     
     for row in suspect_case_overlap:
-        results.append(check_assertion(
+        _record(check_assertion(
             f"Entity {row['entity_id']} linked to ≥ 3 cases",
             row["case_count"] >= 3,
             f"Found {row['case_count']} cases"
         ))
-    print()
+    out.append("")
     
     # =========================================================================
     # CHECK 5: Burner Phone Switch Detection
     # =========================================================================
-    print("📱 CHECK 5: Burner Phone Switch")
-    print("-" * 40)
+    out.append("📱 CHECK 5: Burner Phone Switch")
+    out.append("-" * 40)
     
-    # Check Suspect 1 NOT present after incident
-    suspect1_after = spark.sql(f"""
-        SELECT COUNT(*) as count
-        FROM location_events_silver
-        WHERE entity_id = '{SUSPECT_1_ID}'
-          AND time_bucket >= '{BURNER_SWITCH_BUCKET}'
-    """).collect()[0]["count"]
-    
-    results.append(check_assertion(
+    # Suspect 1's post-switch event count came out of the fused query above
+    suspect1_after = ev["s1_events_after_switch"] or 0
+
+    _record(check_assertion(
         f"Suspect 1 ({SUSPECT_1_ID}) disappears after DC incident",
         suspect1_after == 0,
         f"Found {suspect1_after} events after switch"
     ))
     
     # Check Burner appears at T+1
-    burner_first = spark.sql(f"""
-        SELECT MIN(time_bucket) as first_bucket, h3_cell
-        FROM location_events_silver
-        WHERE entity_id = '{BURNER_ENTITY_ID}'
-        GROUP BY h3_cell
-        ORDER BY first_bucket
-        LIMIT 1
-    """).collect()[0]
+    burner_first = burner_first_future.result()
     
-    results.append(check_assertion(
+    _record(check_assertion(
         f"Burner ({BURNER_ENTITY_ID}) appears at T+1 bucket",
         burner_first["first_bucket"] == BURNER_SWITCH_BUCKET,
         f"First appeared at {burner_first['first_bucket']}"
     ))
     
-    results.append(check_assertion(
+    _record(check_assertion(
         f"Burner appears in same cell as DC incident",
         burner_first["h3_cell"] == DC_INCIDENT_H3_CELL
     ))
     
     # Check Burner continues with Suspect 2
-    burner_with_suspect2 = spark.sql(f"""
-        SELECT COUNT(DISTINCT cp.time_buckets) as shared_windows
-        FROM co_presence_edges cp
-        WHERE (entity_id_1 = '{BURNER_ENTITY_ID}' AND entity_id_2 = '{SUSPECT_2_ID}')
-           OR (entity_id_1 = '{SUSPECT_2_ID}' AND entity_id_2 = '{BURNER_ENTITY_ID}')
-    """).collect()[0]["shared_windows"]
-    
-    results.append(check_assertion(
+    burner_copresent = burner_pair_future.result() is not None
+
+    _record(check_assertion(
         f"Burner and Suspect 2 have co-presence",
-        burner_with_suspect2 > 0,
-        f"Found {burner_with_suspect2} shared time windows"
+        burner_copresent,
+        "No co-presence edge between burner and suspect 2"
     ))
-    print()
+    out.append("")
     
     # =========================================================================
     # CHECK 6: Handoff Detection Returns Correct Pair
     # =========================================================================
-    print("🔍 CHECK 6: Handoff Detection Accuracy")
-    print("-" * 40)
+    out.append("🔍 CHECK 6: Handoff Detection Accuracy")
+    out.append("-" * 40)
     
-    top_handoff = spark.sql("""
-        SELECT old_entity_id, new_entity_id, handoff_score, rank
-        FROM handoff_candidates
-        WHERE rank = 1
-    """).collect()
+    top_handoff = handoff_future.result()
+    assert len(top_handoff) < 100, "validation query returned too many rows"
     
     if top_handoff:
         handoff = top_handoff[0]
-        results.append(check_assertion(
+        _record(check_assertion(
             f"Top handoff candidate: {handoff['old_entity_id']} → {handoff['new_entity_id']}",
             handoff["old_entity_id"] == SUSPECT_1_ID and 
             handoff["new_entity_id"] == BURNER_ENTITY_ID,
             f"Expected {SUSPECT_1_ID} → {BURNER_ENTITY_ID}"
         ))
-        print(f"   Handoff score: {handoff['handoff_score']:.3f}")
+        if verbose:
+            out.append(f"   Handoff score: {handoff['handoff_score']:.3f}")
     else:
-        results.append(check_assertion(
+        _record(check_assertion(
             "Handoff detection found candidates",
             False,
             "No handoff candidates found"
         ))
-    print()
+    out.append("")
     
     # =========================================================================
     # CHECK 7: Suspect Rankings Return Top 2 Correctly
     # =========================================================================
-    print("🏆 CHECK 7: Suspect Rankings Accuracy")
-    print("-" * 40)
+    out.append("🏆 CHECK 7: Suspect Rankings Accuracy")
+    out.append("-" * 40)
     
-    top_suspects = spark.sql("""
-        SELECT entity_id, rank, total_score, states_count, unique_cases
-        FROM suspect_rankings
-        WHERE rank <= 2
-        ORDER BY rank
-    """).collect()
+    ranking_rows = rankings_future.result()
+    # Guardrail: driver-side row lists from these collects should stay
+    # tiny; a larger result means an upstream filter regressed and the
+    # consumer should move to Arrow-backed toPandas
+    assert len(ranking_rows) < 100, "validation query returned too many rows"
+    top_suspects = [r for r in ranking_rows if r["rank"] <= 2]
     
     top_2_ids = [r["entity_id"] for r in top_suspects]
-    results.append(check_assertion(
+    _record(check_assertion(
         f"Top 2 ranked suspects are {SUSPECT_1_ID} and {SUSPECT_2_ID}",
         set(top_2_ids) == {SUSPECT_1_ID, SUSPECT_2_ID},
         f"Got: {top_2_ids}"
     ))
     
-    for suspect in top_suspects:
-        print(f"   Rank {suspect['rank']}: {suspect['entity_id']} "
-              f"(score={suspect['total_score']:.3f}, "
-              f"cases={suspect['unique_cases']}, "
-              f"states={suspect['states_count']})")
-    print()
+    if verbose:
+        for suspect in top_suspects:
+            out.append(f"   Rank {suspect['rank']}: {suspect['entity_id']} "
+                  f"(score={suspect['total_score']:.3f}, "
+                  f"cases={suspect['unique_cases']}, "
+                  f"states={suspect['states_count']})")
+    out.append("")
     
     # =========================================================================
     # CHECK 8: Cross-Jurisdiction Link Exists
     # =========================================================================
-    print("🌐 CHECK 8: Cross-Jurisdiction Connection")
-    print("-" * 40)
+    out.append("🌐 CHECK 8: Cross-Jurisdiction Connection")
+    out.append("-" * 40)
     
-    cross_jurisdiction = spark.sql(f"""
-        SELECT sr.entity_id, sr.states_count, sr.linked_cities
-        FROM suspect_rankings sr
-        WHERE sr.entity_id IN ('{SUSPECT_1_ID}', '{SUSPECT_2_ID}')
-          AND sr.states_count > 1
-    """).collect()
+    cross_jurisdiction = [
+        r for r in ranking_rows
+        if r["entity_id"] in SUSPECT_IDS and r["states_count"] > 1
+    ]
     
-    results.append(check_assertion(
+    _record(check_assertion(
         "Both suspects have cross-jurisdiction presence",
         len(cross_jurisdiction) == 2,
         f"Found {len(cross_jurisdiction)} with multi-state presence"
     ))
-    print()
+    out.append("")
     
+    # Render the full report in a single write
+    report(out)
+
     # =========================================================================
     # SUMMARY
     # =========================================================================
@@ -297,7 +469,7 @@ def run_all_validations():
     print("VALIDATION SUMMARY")
     print("=" * 60)
     
-    passed = sum(results)
+    passed = sum(r.passed for r in results)
     total = len(results)
     success_rate = (passed / total) * 100 if total > 0 else 0
     
@@ -344,7 +516,9 @@ all_passed = run_all_validations()
 # MAGIC SELECT entity_id, time_bucket, h3_cell, city, state
 # MAGIC FROM pubsec_geo_law.demo.location_events_silver
 # MAGIC WHERE entity_id IN ('E_0412', 'E_1098', 'E_7734')
+# MAGIC -- LIMIT turns the global sort into a single-pass top-k (TakeOrderedAndProject)
 # MAGIC ORDER BY time_bucket, entity_id
+# MAGIC LIMIT 500
 
 # COMMAND ----------
 
@@ -384,6 +558,7 @@ all_passed = run_all_validations()
 # MAGIC WHERE entity_id_1 IN ('E_0412', 'E_1098', 'E_7734')
 # MAGIC    OR entity_id_2 IN ('E_0412', 'E_1098', 'E_7734')
 # MAGIC ORDER BY weight DESC
+# MAGIC LIMIT 200
 
 # COMMAND ----------
 